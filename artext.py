@@ -12,7 +12,7 @@
 # + LIONMAD <https://github.com/Midohajhouj>
 # License:           MIT License - https://opensource.org/licenses/MIT
 # Bug-Report:        https://github.com/Midohajhouj/artext-banner/issues
-# Depends:           python3, pyfiglet, termcolor, pillow
+# Depends:           python3, pyfiglet, termcolor, numpy, pillow
 # Conflicts:         None
 # Enhancements:      Support for font customization, image handling with PIL.
 # Packaging:         Available on GitHub for manual installation.
@@ -23,15 +23,27 @@
 # =======================================
 import pyfiglet  # Creates ASCII art banners from text.
 import os  # Provides tools to interact with the operating system, e.g., file and directory manipulation.
-from termcolor import colored  # Adds color and style to terminal output.
+from termcolor import ATTRIBUTES, COLORS as TERMCOLOR_COLORS, RESET  # ANSI code tables for terminal colors and styles.
 import argparse  # Parses command-line arguments for the script.
-from PIL import Image, ImageDraw, ImageFont, ImageOps  # Image processing library for creating and manipulating images.
-from typing import List, Optional, Literal, Dict, Tuple  # Provides support for type hints in function definitions and variable declarations.
+from typing import TYPE_CHECKING, List, Optional, Literal, Dict, Tuple, Sequence  # Provides support for type hints in function definitions and variable declarations.
 import logging  # Provides a flexible framework for emitting log messages.
 from pathlib import Path  # A modern way to handle and manipulate filesystem paths.
 import random  # Generates random numbers, selections, or permutations.
+import re  # Regular expressions, used for input validation.
 import signal  # Handles asynchronous events, such as termination signals.
 import sys  # Provides access to system-specific parameters and functions, like manipulating I/O streams.
+import functools  # Higher-order helpers, used here for caching expensive lookups.
+from concurrent.futures import ProcessPoolExecutor  # Runs CPU-bound rendering across multiple processes.
+from itertools import repeat, zip_longest  # Supplies constant arguments to executor.map and pads batch fields.
+from dataclasses import dataclass, field  # Lightweight classes for plain data containers.
+import mmap  # Memory-maps batch spec files for reading without extra buffering.
+import stat  # Interprets file mode bits, e.g. to tell regular files from pipes.
+
+# numpy, numba and PIL are only needed for gradients and image output,
+# so they are imported inside the functions that use them to keep startup fast.
+if TYPE_CHECKING:
+    import numpy as np  # Vectorized numeric arrays, used for color gradient interpolation.
+    from PIL import Image, ImageFont  # Image processing library for creating and manipulating images.
 
 
 # Constants
@@ -40,13 +52,120 @@ ALIGNMENTS = ["left", "center", "right"]
 TEXT_EFFECTS = ["bold", "underline", "blink", "italic", "strikethrough"]
 CUSTOM_FONTS_DIR = "custom_fonts"  # Directory for custom fonts
 GRADIENT_COLORS = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00", "#00FFFF", "#FF00FF"]  # Gradient color options
+HEX_COLOR_MATCH = re.compile(r"#[0-9A-Fa-f]{6}").fullmatch  # Precompiled HEX color validator
+ANSI_ESCAPE_SUB = re.compile(r"\033\[[0-9;]*m").sub  # Strips terminal color codes (for images and color-less output)
+EFFECT_CODES = {**ATTRIBUTES, "strikethrough": ATTRIBUTES["strike"]}  # TEXT_EFFECTS names mapped to ANSI SGR codes
+OUTPUT_ENCODING = getattr(sys.stdout, "encoding", None) or "utf-8"  # Encoding for pre-encoded terminal output
+
+def _stdout_supports_color() -> bool:
+    """Decides whether to emit ANSI colors, following the same rules as termcolor (empty variables are ignored)."""
+    if os.environ.get("ANSI_COLORS_DISABLED") or os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    if os.environ.get("TERM") == "dumb":
+        return False
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+COLOR_ENABLED = _stdout_supports_color()  # Decided once at startup; off for NO_COLOR or piped output
+ANSI_RESET = RESET if COLOR_ENABLED else ""
+
+def ansi(text: str) -> str:
+    """Returns text unchanged when color is on, or with its ANSI codes stripped when it is off."""
+    return text if COLOR_ENABLED else ANSI_ESCAPE_SUB("", text)
+PAGE_STEPS = {"next": 1, "prev": -1}  # Pagination commands mapped to page offsets
+BATCH_FIELD_SEPARATOR = "|"  # Separates text|font|color|align|effects in --batch spec lines
+
+# Input validators for get_user_input, allocated once at import
+_is_yn = frozenset({"y", "n"}).__contains__
+_is_align = frozenset(ALIGNMENTS).__contains__
+_is_menu_choice = frozenset({"1", "2", "3", "4", "5", "6"}).__contains__
+_is_not_empty = bool
+
+def _is_txt(name: str) -> bool:
+    """Checks that a file name has a .txt extension."""
+    return name.endswith('.txt')
+
+def _is_png(name: str) -> bool:
+    """Checks that a file name has a .png extension."""
+    return name.endswith('.png')
+
+HELP_TEXT = ansi(
+    "\033[1;32mHelp Menu:\033[0m\n"
+    "1. Enter the text for your banner.\n"
+    "2. Select a font from the list.\n"
+    "3. Choose a color for your banner.\n"
+    "4. Optionally, choose text effects (bold, underline, blink, italic, strikethrough).\n"
+    "5. Set the alignment (left, center, right).\n"
+    "6. Save the banner to a file or as an image if desired.\n"
+    "7. Use command-line arguments for quick setup (--text, --font, --color, --align).\n"
+    "8. Batch process multiple banners from a file using --batch.\n"
+)
+MENU_TEXT = ansi(
+    "\033[1;32mMain Menu:\033[0m\n"
+    "1. Generate Banner\n"
+    "2. Generate Banner for All Fonts\n"
+    "3. List Available Fonts\n"
+    "4. Preview Colors\n"
+    "5. Help\n"
+    "6. Exit\n"
+)
 
 # Set up logging
-logging.basicConfig(filename="banner_generator.log", level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logging.basicConfig(
+    handlers=[logging.FileHandler("banner_generator.log", delay=True)],  # Log file is only created on the first record
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
 
 def clear_screen() -> None:
     """Clears the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt' and not os.environ.get('WT_SESSION'):
+        os.system('cls')  # Legacy Windows console without ANSI support
+    else:
+        sys.stdout.write("\033[2J\033[H")
+        sys.stdout.flush()
+
+def _hex_to_rgb(color: str) -> Tuple[int, int, int]:
+    """Converts a HEX color code such as '#FF8800' to an (R, G, B) tuple."""
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+@functools.lru_cache(maxsize=None)
+def _ansi_prefix(color: str, attrs: Tuple[str, ...] = ()) -> str:
+    """Builds the ANSI escape prefix for a color (name or HEX) and text effects, once per combination."""
+    if is_valid_hex(color):
+        codes = ["38;2;{};{};{}".format(*_hex_to_rgb(color))]
+    else:
+        codes = [str(TERMCOLOR_COLORS[color])]
+    codes.extend(str(EFFECT_CODES[attr]) for attr in attrs)
+    if not COLOR_ENABLED:
+        return ""
+    return "".join(f"\033[{code}m" for code in codes)
+
+def stylize(text: str, color: str, attrs: Optional[List[str]] = None) -> str:
+    """Wraps text in the cached ANSI prefix for the color and effects, followed by a reset (plain text when color is off)."""
+    return _ansi_prefix(color, tuple(sorted(attrs)) if attrs else ()) + text + ANSI_RESET
+
+@functools.lru_cache(maxsize=64)
+def _gradient_escapes(width: int, start: str, end: str) -> Tuple[str, ...]:
+    """Returns one 24-bit color escape per column, linearly interpolated from start to end (empty when color is off)."""
+    if not COLOR_ENABLED:
+        return ("",) * width
+    import numpy as np
+
+    rgb = np.linspace(_hex_to_rgb(start), _hex_to_rgb(end), width).astype(np.uint8)
+    return tuple(f"\033[38;2;{r};{g};{b}m" for r, g, b in rgb.tolist())
+
+@functools.lru_cache(maxsize=None)
+def _get_figlet(font: str, align: str = "auto") -> pyfiglet.Figlet:
+    """Returns a Figlet renderer for the font, loading each font file only once."""
+    return pyfiglet.Figlet(font=font, justify=align)
+
+@functools.lru_cache(maxsize=512)
+def _figlet_cached(text: str, font: str, align: str = "auto") -> str:
+    """Renders text with pyfiglet, memoized per (text, font, align)."""
+    return _get_figlet(font, align).renderText(text)
 
 def generate_banner(
     text: str, 
@@ -58,29 +177,33 @@ def generate_banner(
 ) -> str:
     """Generates a banner with the given text, font, color, alignment, and text effects."""
     try:
-        banner = pyfiglet.figlet_format(text, font=font, justify=align)
+        banner = _figlet_cached(text, font, align)
         if gradient:
-            # Apply gradient color to the banner
-            from colorama import Fore
-            gradient_banner = ""
-            for i, line in enumerate(banner.splitlines()):
-                gradient_banner += Fore.GREEN + line + Fore.RESET + "\n"  # Example gradient (can be improved)
-            return gradient_banner
+            # Apply a left-to-right gradient, one escape per column
+            lines = banner.splitlines()
+            escapes = _gradient_escapes(max(map(len, lines), default=0), *gradient)
+            return "".join(["".join(map(str.__add__, escapes, line)) + ANSI_RESET + "\n" for line in lines])
         else:
-            colored_banner = colored(banner, color, attrs=attrs)
-        logging.info(f"Banner generated: {text}, font: {font}, color: {color}, align: {align}, attrs: {attrs}")
+            colored_banner = stylize(banner, color, attrs)
+        if logging.root.isEnabledFor(logging.INFO):
+            logging.info("Banner generated: %s, font: %s, color: %s, align: %s, attrs: %s", text, font, color, align, attrs)
         return colored_banner
     except Exception as e:
-        logging.error(f"Error generating banner: {str(e)}")
+        logging.error("Error generating banner: %s", e)
         return f"Error: {str(e)}"
 
-def list_fonts() -> List[str]:
-    """Returns a list of available fonts, including custom fonts."""
-    fonts = pyfiglet.FigletFont.getFonts()
+@functools.lru_cache(maxsize=1)
+def list_fonts() -> Tuple[str, ...]:
+    """Returns the available fonts, including custom fonts (cached after the first scan)."""
+    fonts = list(pyfiglet.FigletFont.getFonts())
     if os.path.exists(CUSTOM_FONTS_DIR):
         custom_fonts = [f for f in os.listdir(CUSTOM_FONTS_DIR) if f.endswith('.flf')]
         fonts.extend(custom_fonts)
-    return fonts
+    return tuple(fonts)
+
+def _invalidate_font_cache() -> None:
+    """Forgets the cached font list, e.g. after a font is added to CUSTOM_FONTS_DIR."""
+    list_fonts.cache_clear()
 
 def get_user_input(prompt: str, default: Optional[str] = None, validation_func: Optional[callable] = None) -> str:
     """Gets user input with optional validation and default value."""
@@ -90,55 +213,73 @@ def get_user_input(prompt: str, default: Optional[str] = None, validation_func:
             return default
         if validation_func is None or validation_func(user_input):
             return user_input
-        print("\033[1;31mInvalid input! Try again.\033[0m")
+        print(ansi("\033[1;31mInvalid input! Try again.\033[0m"))
+
+@dataclass
+class Paginator:
+    """Splits a fixed sequence of items into pages; the page count is computed once."""
+    items: Tuple[str, ...]
+    per_page: int = 10
+    pages: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        full_pages, remainder = divmod(len(self.items), self.per_page)
+        self.pages = max(1, full_pages + (1 if remainder else 0))
 
-def show_items(items: List[str], page: int = 1, per_page: int = 10) -> None:
-    """Displays a paginated list of available items."""
-    start = (page - 1) * per_page
-    end = start + per_page
-    for idx, item in enumerate(items[start:end], start=start + 1):
-        print(f"[{idx}] {item}")
-    print(f"\nPage {page} of {len(items) // per_page + 1}")
-    print("Type 'next' to see more items, 'prev' to go back, or select an item by number or name.")
+    def page(self, number: int) -> Tuple[Tuple[str, ...], int]:
+        """Returns the items on the given 1-based page and the index of the first one."""
+        start = (number - 1) * self.per_page
+        return self.items[start:start + self.per_page], start
+
+def show_items(paginator: Paginator, page: int = 1) -> None:
+    """Displays one page of a paginated list of available items."""
+    page_items, start = paginator.page(page)
+    listing = "".join(f"[{idx}] {item}\n" for idx, item in enumerate(page_items, start=start + 1))
+    sys.stdout.write(
+        f"{listing}"
+        f"\nPage {page} of {paginator.pages}\n"
+        "Type 'next' to see more items, 'prev' to go back, or select an item by number or name.\n"
+    )
 
 def color_preview(color: str, text: str = "This is a preview of the color.", font: str = "standard") -> None:
     """Displays a preview of the selected color and font."""
-    banner = pyfiglet.figlet_format(text, font=font)
-    print(colored(banner, color))
+    banner = _figlet_cached(text, font)
+    print(stylize(banner, color))
 
 def show_font_preview(font: str, color: str, attrs: Optional[List[str]] = None) -> None:
     """Displays a preview of the selected font and color."""
     preview = generate_banner("Preview", font, color, attrs=attrs)
     print(preview)
 
-def select_from_list(items: List[str], prompt: str, default: Optional[str] = None) -> Optional[str]:
+def select_from_list(items: Sequence[str], prompt: str, default: Optional[str] = None) -> Optional[str]:
     """Generic function to select an item from a list."""
+    paginator = Paginator(tuple(items))
     page = 1
     while True:
         print(f"\nAvailable {prompt}:")
-        show_items(items, page)
+        show_items(paginator, page)
         user_input = get_user_input(f"\nEnter the {prompt} name or number (or press Enter for default '{default}'), 'exit' to quit: ", default=default)
-        
-        if user_input.lower() == 'exit':
+        command = user_input.lower()
+        step = PAGE_STEPS.get(command)
+
+        if command == 'exit':
             return None
-        if user_input.isdigit():
+        if step is not None:
+            page = min(paginator.pages, max(1, page + step))
+        elif user_input.isdigit():
             index = int(user_input) - 1
             if 0 <= index < len(items):
                 return items[index]
             else:
-                print("\033[1;31mInvalid number! Try again.\033[0m")
-        elif user_input.lower() == 'next':
-            page += 1
-        elif user_input.lower() == 'prev':
-            page = max(1, page - 1)
+                print(ansi("\033[1;31mInvalid number! Try again.\033[0m"))
         elif user_input in items:
             return user_input
         else:
-            print("\033[1;31mInvalid input! Try again.\033[0m")
+            print(ansi("\033[1;31mInvalid input! Try again.\033[0m"))
 
 def is_valid_hex(color: str) -> bool:
     """Validates a HEX color code."""
-    return color.startswith('#') and len(color) == 7 and all(c in '0123456789ABCDEFabcdef' for c in color[1:])
+    return HEX_COLOR_MATCH(color) is not None
 
 def select_color(font: str = "standard") -> str:
     """Handles color selection with preview."""
@@ -146,11 +287,11 @@ def select_color(font: str = "standard") -> str:
         color = get_user_input("Enter the color name or HEX code (or press Enter for default 'white'): ", default="white")
         if color in COLORS or is_valid_hex(color):
             color_preview(color, text="This is a preview of the color.", font=font)
-            confirm = get_user_input("Is this color okay? (y/n): ", default="y", validation_func=lambda x: x in ["y", "n"])
+            confirm = get_user_input("Is this color okay? (y/n): ", default="y", validation_func=_is_yn)
             if confirm == 'y':
                 return color
         else:
-            print("\033[1;31mInvalid color! Try again.\033[0m")
+            print(ansi("\033[1;31mInvalid color! Try again.\033[0m"))
 
 def select_text_effects() -> Optional[List[str]]:
     """Handles text effects selection."""
@@ -162,53 +303,96 @@ def select_text_effects() -> Optional[List[str]]:
         if all(effect in TEXT_EFFECTS for effect in effects_list):
             return effects_list
         else:
-            print("\033[1;31mInvalid text effects! Try again.\033[0m")
+            print(ansi("\033[1;31mInvalid text effects! Try again.\033[0m"))
 
 def save_banner(banner: str) -> None:
     """Saves the generated banner to a file."""
-    save_option = get_user_input("Do you want to save the banner to a file? (y/n): ", default="n", validation_func=lambda x: x in ["y", "n"])
+    save_option = get_user_input("Do you want to save the banner to a file? (y/n): ", default="n", validation_func=_is_yn)
     if save_option == 'y':
-        file_name = get_user_input("Enter the file name (with .txt extension): ", validation_func=lambda x: x.endswith('.txt'))
+        file_name = get_user_input("Enter the file name (with .txt extension): ", validation_func=_is_txt)
         try:
-            with open(file_name, 'w') as f:
-                f.write(banner)
-            print(f"\033[1;32mBanner saved as {file_name}\033[0m")
-            logging.info(f"Banner saved as {file_name}")
+            Path(file_name).write_text(banner, encoding='utf-8')
+            print(ansi(f"\033[1;32mBanner saved as {file_name}\033[0m"))
+            logging.info("Banner saved as %s", file_name)
         except Exception as e:
-            print(f"\033[1;31mError saving file: {str(e)}\033[0m")
-            logging.error(f"Error saving file: {str(e)}")
+            print(ansi(f"\033[1;31mError saving file: {str(e)}\033[0m"))
+            logging.error("Error saving file: %s", e)
+
+@functools.lru_cache(maxsize=32)
+def _get_font(size: int) -> "ImageFont.FreeTypeFont":
+    """Returns the default PIL font at the given size, loaded once per size."""
+    from PIL import ImageFont
+
+    return ImageFont.load_default().font_variant(size=size)
+
+@functools.lru_cache(maxsize=1)
+def _compiled_gradient_kernel():
+    """JIT-compiles the gradient fill kernel with numba on first use; returns None if numba is not installed."""
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
 
-def save_banner_as_image(banner: str, file_name: str = "banner.png") -> None:
-    """Saves the generated banner as an image."""
-    save_option = get_user_input("Do you want to save the banner as an image? (y/n): ", default="n", validation_func=lambda x: x in ["y", "n"])
+    @njit(parallel=True, cache=True)
+    def gradient_rgb_kernel(w: int, h: int, r0: int, g0: int, b0: int, r1: int, g1: int, b1: int, out: "np.ndarray") -> None:
+        """Fills out (h x w x 3) with a horizontal gradient from (r0, g0, b0) to (r1, g1, b1)."""
+        for y in prange(h):
+            for x in range(w):
+                t = x / (w - 1) if w > 1 else 0.0
+                out[y, x, 0] = int(r0 + (r1 - r0) * t)
+                out[y, x, 1] = int(g0 + (g1 - g0) * t)
+                out[y, x, 2] = int(b0 + (b1 - b0) * t)
+
+    return gradient_rgb_kernel
+
+def gradient_image(width: int, height: int, start: str, end: str) -> "Image.Image":
+    """Returns an RGB image filled with a horizontal gradient between two HEX colors."""
+    import numpy as np
+    from PIL import Image
+
+    buf = np.empty((height, width, 3), np.uint8)
+    kernel = _compiled_gradient_kernel()
+    if kernel is not None:
+        kernel(width, height, *_hex_to_rgb(start), *_hex_to_rgb(end), buf)
+    else:
+        buf[:] = np.linspace(_hex_to_rgb(start), _hex_to_rgb(end), width).astype(np.uint8)
+    return Image.frombuffer('RGB', (width, height), buf, 'raw', 'RGB', 0, 1)
+
+def save_banner_as_image(banner: str, file_name: str = "banner.png", gradient: Optional[Tuple[str, str]] = None) -> None:
+    """Saves the generated banner as an image, optionally filling the text with a gradient."""
+    save_option = get_user_input("Do you want to save the banner as an image? (y/n): ", default="n", validation_func=_is_yn)
     if save_option == 'y':
-        file_name = get_user_input("Enter the file name (with .png extension): ", default="banner.png", validation_func=lambda x: x.endswith('.png'))
+        file_name = get_user_input("Enter the file name (with .png extension): ", default="banner.png", validation_func=_is_png)
         image_width = int(get_user_input("Enter image width (default 800): ", default="800"))
         image_height = int(get_user_input("Enter image height (default 200): ", default="200"))
         font_size = int(get_user_input("Enter font size (default 20): ", default="20"))
         try:
+            from PIL import Image, ImageDraw
+
             image = Image.new('RGB', (image_width, image_height), color=(0, 0, 0))
-            draw = ImageDraw.Draw(image)
-            font = ImageFont.load_default().font_variant(size=font_size)
-            draw.text((10, 10), banner, font=font, fill=(255, 255, 255))
-            image.save(file_name)
-            print(f"\033[1;32mBanner saved as {file_name}\033[0m")
-            logging.info(f"Banner saved as {file_name}")
+            font = _get_font(font_size)
+            plain_banner = ANSI_ESCAPE_SUB("", banner)
+            if gradient:
+                # Span the gradient over the drawn text only, matching the terminal gradient across the banner width
+                mask = Image.new('L', (image_width, image_height), 0)
+                mask_draw = ImageDraw.Draw(mask)
+                mask_draw.text((10, 10), plain_banner, font=font, fill=255)
+                left, top, right, bottom = mask_draw.textbbox((10, 10), plain_banner, font=font)
+                if right > left and bottom > top:
+                    fill = gradient_image(right - left, bottom - top, *gradient)
+                    image.paste(fill, (left, top), mask.crop((left, top, right, bottom)))
+            else:
+                ImageDraw.Draw(image).text((10, 10), plain_banner, font=font, fill=(255, 255, 255))
+            image.save(file_name, 'PNG', optimize=False, compress_level=1)  # Fast zlib level; banners are mostly flat color
+            print(ansi(f"\033[1;32mBanner saved as {file_name}\033[0m"))
+            logging.info("Banner saved as %s", file_name)
         except Exception as e:
-            print(f"\033[1;31mError saving image: {str(e)}\033[0m")
-            logging.error(f"Error saving image: {str(e)}")
+            print(ansi(f"\033[1;31mError saving image: {str(e)}\033[0m"))
+            logging.error("Error saving image: %s", e)
 
 def show_help() -> None:
     """Displays a help menu with instructions."""
-    print("\033[1;32mHelp Menu:\033[0m")
-    print("1. Enter the text for your banner.")
-    print("2. Select a font from the list.")
-    print("3. Choose a color for your banner.")
-    print("4. Optionally, choose text effects (bold, underline, blink, italic, strikethrough).")
-    print("5. Set the alignment (left, center, right).")
-    print("6. Save the banner to a file or as an image if desired.")
-    print("7. Use command-line arguments for quick setup (--text, --font, --color, --align).")
-    print("8. Batch process multiple banners from a file using --batch.")
+    sys.stdout.write(HELP_TEXT)
 
 def parse_arguments() -> argparse.Namespace:
     """Parses command-line arguments."""
@@ -222,6 +406,8 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument("--height", type=int, help="Image height for saving as image")
     parser.add_argument("--font-size", type=int, help="Font size for saving as image")
     parser.add_argument("--output", type=str, help="Output file name (for text or image)")
+    parser.add_argument("--gradient", type=str, help="Gradient HEX colors (comma-separated start,end, e.g., #FF0000,#0000FF)")
+    parser.add_argument("--quiet", action="store_true", help="Only log warnings and errors")
     parser.add_argument("--batch", type=str, help="Batch process multiple banners from a file")
     return parser.parse_args()
 
@@ -229,11 +415,11 @@ def generate_banner_flow() -> None:
     """Handles the banner generation flow."""
     args = parse_arguments()
     clear_screen()
-    print("\033[1;32mWelcome to the Customizable Banner Generator!\033[0m\n")
+    print(ansi("\033[1;32mWelcome to the Customizable Banner Generator!\033[0m\n"))
     show_help()
 
     # Get banner text
-    text = args.text if args.text else get_user_input("Enter the text for your banner: ", validation_func=lambda x: x != "")
+    text = args.text if args.text else get_user_input("Enter the text for your banner: ", validation_func=_is_not_empty)
     
     # Select font
     fonts = list_fonts()
@@ -246,42 +432,138 @@ def generate_banner_flow() -> None:
     effects = args.effects.split(",") if args.effects else select_text_effects()
 
     # Get alignment
-    align = args.align if args.align else get_user_input("Enter alignment (left/center/right, or press Enter for default 'left'): ", default="left", validation_func=lambda x: x in ALIGNMENTS)
+    align = args.align if args.align else get_user_input("Enter alignment (left/center/right, or press Enter for default 'left'): ", default="left", validation_func=_is_align)
+
+    # Get optional gradient
+    gradient = tuple(args.gradient.split(",")) if args.gradient else None
+    if gradient and (len(gradient) != 2 or not all(is_valid_hex(c) for c in gradient)):
+        print(ansi("\033[1;31mInvalid gradient! Expected two HEX colors, e.g., #FF0000,#0000FF.\033[0m"))
+        gradient = None
 
     # Generate and display banner
-    banner = generate_banner(text, font, color, align, effects)
-    print("\n\033[1;34mHere is your banner:\033[0m\n")
+    banner = generate_banner(text, font, color, align, effects, gradient)
+    print(ansi("\n\033[1;34mHere is your banner:\033[0m\n"))
     print(banner)
 
     # Save banner to file or image
     save_banner(banner)
-    save_banner_as_image(banner)
+    save_banner_as_image(banner, gradient=gradient)
+
+def write_bytes(data: bytes, end: bytes = b"\n") -> None:
+    """Writes pre-encoded output straight to the stdout buffer, bypassing the text codec."""
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write((data + end).decode(OUTPUT_ENCODING, errors="replace"))
+    else:
+        buffer.write(data)
+        buffer.write(end)
+        buffer.flush()
+
+def _init_worker() -> None:
+    """Ignores SIGINT in pool workers so Ctrl+C is handled once, by the main process."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _render(text: str, font: str, color: str, align: str = "left", effects: Optional[List[str]] = None) -> Tuple[str, str, bytes]:
+    """Renders a single banner, returning its font name, the exact text and the terminal-encoded bytes.
+
+    Top-level so worker processes can pickle it; only the bytes are lossy, and they are only written to the terminal.
+    """
+    banner = generate_banner(text, font, color, align, effects)
+    return font, banner, banner.encode(OUTPUT_ENCODING, errors="replace")
 
 def generate_all_fonts_banner(text: str, color: str, align: str = "left", effects: Optional[List[str]] = None) -> None:
-    """Generates banners for all available fonts with the given text."""
+    """Generates banners for all available fonts with the given text, skipping fonts whose output repeats an earlier one."""
     fonts = list_fonts()
-    for font in fonts:
-        banner = generate_banner(text, font, color, align, effects)
-        print(f"\n\033[1;34mFont: {font}\033[0m\n")
+    seen = set()
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker) as executor:
+        results = executor.map(_render, repeat(text), fonts, repeat(color), repeat(align), repeat(effects), chunksize=16)
+        for font, banner, banner_bytes in results:
+            if banner in seen:
+                continue
+            seen.add(banner)
+            print(ansi(f"\n\033[1;34mFont: {font}\033[0m\n"))
+            write_bytes(banner_bytes)
+            save_option = get_user_input("Do you want to save this banner? (y/n): ", default="n", validation_func=_is_yn)
+            if save_option == 'y':
+                save_banner(banner)
+                save_banner_as_image(banner)
+    if len(seen) < len(fonts):
+        print(ansi(f"\n\033[1;33mSkipped {len(fonts) - len(seen)} fonts with duplicate output.\033[0m"))
+
+def read_batch_specs(path: str) -> List[str]:
+    """Reads the non-empty spec lines from a batch file, memory-mapping regular files.
+
+    Pipes, FIFOs and stdin cannot be mapped, so those are read normally.
+    Raises ValueError naming the offending line if the file is not valid UTF-8.
+    """
+    with open(path, 'rb') as f:
+        info = os.fstat(f.fileno())
+        if not stat.S_ISREG(info.st_mode):
+            data = f.read()
+        elif info.st_size == 0:
+            return []  # mmap cannot map an empty file
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = mm.read()
+    specs = []
+    for number, line in enumerate(data.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            specs.append(line.decode("utf-8"))
+        except UnicodeDecodeError as e:
+            raise ValueError(f"line {number} is not valid UTF-8 ({e.reason})") from e
+    return specs
+
+def _render_spec(spec: str, font: str = "standard", color: str = "white", align: str = "left", effects: str = "") -> str:
+    """Renders one batch spec line of the form 'text|font|color|align|effects'; empty or missing fields use the defaults."""
+    text, *overrides = [part.strip() for part in spec.split(BATCH_FIELD_SEPARATOR)]
+    font, color, align, effects = [
+        override or default for override, default in zip_longest(overrides[:4], (font, color, align, effects), fillvalue="")
+    ]
+    return generate_banner(text, font, color, align, [effect.strip() for effect in effects.split(",")] if effects else None)
+
+def batch_process(args: argparse.Namespace) -> bool:
+    """Renders every banner spec in the --batch file in parallel and prints (or saves) them in order.
+
+    Returns False if the batch file could not be read or the output could not be saved.
+    """
+    try:
+        specs = read_batch_specs(args.batch)
+    except (OSError, ValueError) as e:
+        print(ansi(f"\033[1;31mError reading batch file: {str(e)}\033[0m"))
+        logging.error("Error reading batch file: %s", e)
+        return False
+    render = functools.partial(
+        _render_spec,
+        font=args.font or "standard",
+        color=args.color or "white",
+        align=args.align or "left",
+        effects=args.effects or "",
+    )
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker) as executor:
+        banners = list(executor.map(render, specs, chunksize=32))
+    for banner in banners:
         print(banner)
-        save_option = get_user_input("Do you want to save this banner? (y/n): ", default="n", validation_func=lambda x: x in ["y", "n"])
-        if save_option == 'y':
-            save_banner(banner)
-            save_banner_as_image(banner)
+    if args.output:
+        try:
+            Path(args.output).write_text("\n".join(banners), encoding='utf-8')
+            print(ansi(f"\033[1;32mBanners saved as {args.output}\033[0m"))
+            logging.info("Batch of %d banners saved as %s", len(banners), args.output)
+        except Exception as e:
+            print(ansi(f"\033[1;31mError saving file: {str(e)}\033[0m"))
+            logging.error("Error saving file: %s", e)
+            return False
+    return True
 
 def show_menu() -> None:
     """Displays the main menu."""
-    print("\033[1;32mMain Menu:\033[0m")
-    print("1. Generate Banner")
-    print("2. Generate Banner for All Fonts")
-    print("3. List Available Fonts")
-    print("4. Preview Colors")
-    print("5. Help")
-    print("6. Exit")
+    sys.stdout.write(MENU_TEXT)
 
 def signal_handler(sig, frame):
     """Handles Ctrl+C (SIGINT) gracefully."""
-    print("\n\033[1;31mCtrl+C pressed. Exiting...\033[0m")
+    print(ansi("\n\033[1;31mCtrl+C pressed. Exiting...\033[0m"))
     sys.exit(0)
 
 def main_menu() -> None:
@@ -289,14 +571,14 @@ def main_menu() -> None:
     signal.signal(signal.SIGINT, signal_handler)
     while True:
         show_menu()
-        choice = get_user_input("Enter your choice (1-6): ", validation_func=lambda x: x in ["1", "2", "3", "4", "5", "6"])
+        choice = get_user_input("Enter your choice (1-6): ", validation_func=_is_menu_choice)
         if choice == "1":
             generate_banner_flow()
         elif choice == "2":
-            text = get_user_input("Enter the text for your banner: ", validation_func=lambda x: x != "")
+            text = get_user_input("Enter the text for your banner: ", validation_func=_is_not_empty)
             color = select_color()
             effects = select_text_effects()
-            align = get_user_input("Enter alignment (left/center/right, or press Enter for default 'left'): ", default="left", validation_func=lambda x: x in ALIGNMENTS)
+            align = get_user_input("Enter alignment (left/center/right, or press Enter for default 'left'): ", default="left", validation_func=_is_align)
             generate_all_fonts_banner(text, color, align, effects)
         elif choice == "3":
             fonts = list_fonts()
@@ -307,8 +589,15 @@ def main_menu() -> None:
         elif choice == "5":
             show_help()
         elif choice == "6":
-            print("\033[1;32mExiting...\033[0m")
+            print(ansi("\033[1;32mExiting...\033[0m"))
             break
 
 if __name__ == "__main__":
-    main_menu()
+    cli_args = parse_arguments()
+    if cli_args.quiet:
+        logging.root.setLevel(logging.WARNING)
+    if cli_args.batch:
+        if not batch_process(cli_args):
+            sys.exit(1)
+    else:
+        main_menu()